@@ -44,6 +44,13 @@ var artifactGenerator = app.Services.GetRequiredService<ArtifactGenerator>();
 var fcSigner = app.Services.GetRequiredService<FcSigner>();
 var ed25519Signer = app.Services.GetRequiredService<Ed25519Signer>();
 
+var packIndexJsonOpts = new System.Text.Json.JsonSerializerOptions
+{
+    PropertyNamingPolicy = System.Text.Json.JsonNamingPolicy.CamelCase,
+    DefaultIgnoreCondition = System.Text.Json.Serialization.JsonIgnoreCondition.WhenWritingNull,
+    WriteIndented = true
+};
+
 // Helper: build advisory reasons from intents, then sign via FC
 JudgeAdvisoryReceipt GenerateSignedAdvisory(
     ArtifactGenerator gen, string runId, string tenantId, List<SideEffectIntent> intents,
@@ -278,14 +285,11 @@ app.MapPost("/marketops/proofpack", async (HttpContext context) =>
         app.Logger.LogInformation("Proof Pack generated: {PackId} with {RunCount} runs, seal={Seal}",
             packIndex.PackId, packIndex.Runs.Count, packIndex.PackSha256);
 
-        var packJson = System.Text.Json.JsonSerializer.Serialize(packIndex, new System.Text.Json.JsonSerializerOptions
-        {
-            PropertyNamingPolicy = System.Text.Json.JsonNamingPolicy.CamelCase,
-            DefaultIgnoreCondition = System.Text.Json.Serialization.JsonIgnoreCondition.WhenWritingNull,
-            WriteIndented = true
-        });
+        // Serialize fully before sending so a failure still reaches the error response
+        // below; UTF-8 bytes skip the intermediate string
+        var packJson = System.Text.Json.JsonSerializer.SerializeToUtf8Bytes(packIndex, packIndexJsonOpts);
         context.Response.ContentType = "application/json";
-        await context.Response.WriteAsync(packJson);
+        await context.Response.Body.WriteAsync(packJson);
     }
     catch (Exception ex)
     {
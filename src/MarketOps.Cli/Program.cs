@@ -102,8 +102,8 @@ public static class Program
         if (!string.Equals(packet.ActorId, config.ActorId, StringComparison.Ordinal))
             return new GateCliReceipt("precheck", GateResult.Deny(FailureStage.Precheck, "ACTOR_MISMATCH", "Actor mismatch", packet, packetHash));
 
-        var deniedDests = packet.Destinations.Where(d => !config.IsDestinationAllowed(d)).ToList();
-        if (deniedDests.Count > 0)
+        var deniedDests = config.FindDeniedDestinations(packet.Destinations);
+        if (deniedDests != null)
             return new GateCliReceipt("precheck", GateResult.Deny(FailureStage.Precheck, "DESTINATION_NOT_ALLOWED", $"Denied: {string.Join(", ", deniedDests)}", packet, packetHash));
 
         return new GateCliReceipt("precheck", new GateResult(true, null, null, null, packetHash, packet, null));
@@ -191,8 +191,19 @@ public static class Program
         if (Uri.TryCreate(path, UriKind.Absolute, out _)) return false;
         if (path.StartsWith("/", StringComparison.Ordinal) || path.StartsWith("\\", StringComparison.Ordinal)) return false;
         if (Path.IsPathRooted(path)) return false;
-        var segments = path.Split(new[] { '/', '\\' }, StringSplitOptions.RemoveEmptyEntries);
-        return !segments.Any(s => s == ".." || s.Contains(':', StringComparison.Ordinal));
+        if (path.Contains(':', StringComparison.Ordinal)) return false;
+
+        // Walk segments in place rather than splitting into a string array per check
+        var remaining = path.AsSpan();
+        while (!remaining.IsEmpty)
+        {
+            var separator = remaining.IndexOfAny('/', '\\');
+            var segment = separator < 0 ? remaining : remaining[..separator];
+            if (segment is "..") return false;
+            remaining = separator < 0 ? ReadOnlySpan<char>.Empty : remaining[(separator + 1)..];
+        }
+
+        return true;
     }
 
     private static bool IsHelp(string arg) => arg is "-h" or "--help" or "help";
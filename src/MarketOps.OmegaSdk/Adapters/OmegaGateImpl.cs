@@ -62,8 +62,8 @@ public sealed class OmegaGate : IMarketOpsGate
             if (!string.Equals(packet.ActorId, _config.ActorId, StringComparison.Ordinal))
                 return GateResult.Deny(FailureStage.Precheck, "ACTOR_MISMATCH", "Actor mismatch", packet, packetHashSha256);
 
-            var deniedDests = packet.Destinations.Where(d => !_config.IsDestinationAllowed(d)).ToList();
-            if (deniedDests.Count > 0)
+            var deniedDests = _config.FindDeniedDestinations(packet.Destinations);
+            if (deniedDests != null)
                 return GateResult.Deny(FailureStage.Precheck, "DESTINATION_NOT_ALLOWED", $"Denied: {string.Join(", ", deniedDests)}", packet, packetHashSha256);
 
             var decisionRequest = BuildDecisionRequest(packet);
@@ -72,9 +72,11 @@ public sealed class OmegaGate : IMarketOpsGate
             if (!decisionResult.Success || decisionResult.Outcome != "approved")
                 return GateResult.Deny(FailureStage.Decision, "DECISION_NOT_APPROVED", decisionResult.ErrorMessage ?? "Not approved", packet, packetHashSha256);
 
+            // Resolve the decision time once so the audit receipt and governance evidence agree
+            var decidedAtUtc = decisionResult.DecidedAtUtc ?? DateTimeOffset.UtcNow;
             var auditResult = await _auditWriter.WriteReceiptAndPackAsync(
                 new GovernanceReceiptData(decisionResult.ReceiptId ?? "unknown", packet.TenantId, packet.CorrelationId,
-                    decisionResult.Outcome ?? "unknown", decisionResult.DecidedAtUtc ?? DateTimeOffset.UtcNow, new { }),
+                    decisionResult.Outcome ?? "unknown", decidedAtUtc, new { }),
                 packet.ArtifactId, ct: ct);
 
             if (!auditResult.Success)
@@ -144,7 +146,7 @@ public sealed class OmegaGate : IMarketOpsGate
             var governance = new GovernanceEvidence(
                 decisionResult.ReceiptId ?? "unknown",
                 decisionResult.Outcome ?? "approved",
-                decisionResult.DecidedAtUtc ?? DateTimeOffset.UtcNow,
+                decidedAtUtc,
                 auditResult.ReceiptPath ?? "unavailable",
                 auditResult.EvidencePackZipPath ?? "unavailable",
                 verificationSummary);
@@ -222,7 +224,18 @@ public sealed class OmegaGate : IMarketOpsGate
         if (Uri.TryCreate(path, UriKind.Absolute, out _)) return false;
         if (path.StartsWith("/") || path.StartsWith("\\")) return false;
         if (Path.IsPathRooted(path)) return false;
-        var segments = path.Split(new[] { '/', '\\' }, StringSplitOptions.RemoveEmptyEntries);
-        return !segments.Any(s => s == ".." || s.Contains(':'));
+        if (path.Contains(':')) return false;
+
+        // Walk segments in place rather than splitting into a string array per check
+        var remaining = path.AsSpan();
+        while (!remaining.IsEmpty)
+        {
+            var separator = remaining.IndexOfAny('/', '\\');
+            var segment = separator < 0 ? remaining : remaining[..separator];
+            if (segment is "..") return false;
+            remaining = separator < 0 ? ReadOnlySpan<char>.Empty : remaining[(separator + 1)..];
+        }
+
+        return true;
     }
 }
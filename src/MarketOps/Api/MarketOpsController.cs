@@ -160,8 +160,9 @@ public sealed class MarketOpsController
         if (state.Plan == null || state.Ledger == null)
             throw new InvalidOperationException($"Artifacts not available for run: {runId}");
 
+        // Generate the summary once and render the markdown from that same instance
         var summary = await GetSummaryAsync(runId, ct);
-        var markdown = await GetSummaryMarkdownAsync(runId, ct);
+        var markdown = new ApproverSummaryMarkdownRenderer().Render(summary);
 
         return new ProofPackRunInput(
             RunId: runId,
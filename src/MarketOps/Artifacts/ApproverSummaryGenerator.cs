@@ -37,6 +37,10 @@ public sealed class ApproverSummaryGenerator
         var blockedByPolicy = intents.Count(i => i.BlockedByPolicy);
         var wouldExecute = intents.Count(i => !i.BlockedByMode && !i.BlockedByPolicy);
 
+        // Hygiene descriptions repeat across repos ("CODEOWNERS file is missing"),
+        // so each distinct description is digested once per summary
+        var digestCache = new Dictionary<string, string>(StringComparer.Ordinal);
+
         // Group intents by repo path → one OperationSummaryItem per repo
         var topOps = intents
             .GroupBy(i => i.Target)
@@ -49,7 +53,7 @@ public sealed class ApproverSummaryGenerator
 
                 return new OperationSummaryItem(
                     IntentId: rep.Id,
-                    EffectType: rep.EffectType.ToString(),
+                    EffectType: rep.EffectType.ToName(),
                     Target: new OperationTarget(
                         RepoPath: group.Key,
                         Branch: ExtractParam(rep, "branch") ?? "main",
@@ -57,16 +61,20 @@ public sealed class ApproverSummaryGenerator
                     Status: GetGroupStatus(anyByMode, anyByPolicy),
                     Blocked: new BlockedStatus(ByMode: anyByMode, ByPolicy: anyByPolicy),
                     BlockReasons: BuildBlockReasons(repoIntents),
-                    Items: repoIntents.Select(BuildChangeItem).ToList());
+                    Items: repoIntents.Select(i => BuildChangeItem(i, digestCache)).ToList());
             })
             .ToList();
 
         // Scope rollup — repos + issues by type
-        var issuesByType = intents
-            .Select(i => ExtractParam(i, "issue_type")
-                         ?? (i.BlockedByPolicy ? DeterminePolicyViolationType(i) : "unknown"))
-            .GroupBy(t => t)
-            .ToDictionary(g => g.Key, g => g.Count());
+        // Count straight into the dictionary rather than materializing GroupBy buckets;
+        // first-seen key order is the same either way
+        var issuesByType = new Dictionary<string, int>();
+        foreach (var i in intents)
+        {
+            var issueType = ExtractParam(i, "issue_type")
+                            ?? (i.BlockedByPolicy ? DeterminePolicyViolationType(i) : "unknown");
+            issuesByType[issueType] = issuesByType.GetValueOrDefault(issueType) + 1;
+        }
 
         var distinctRepos = intents.Select(i => i.Target).Distinct().ToList();
         var scope = new ScopeRollup(
@@ -97,16 +105,18 @@ public sealed class ApproverSummaryGenerator
                 ? "violations_detected"
                 : "clear";
 
+        // One clock read: completion, duration and issuance all describe the same instant
+        var completedAt = DateTimeOffset.UtcNow;
         var metadata = new RunMetadata(
             Status: "completed",
             StartedAt: startedAt,
-            CompletedAt: DateTimeOffset.UtcNow,
-            DurationSeconds: (int)(DateTimeOffset.UtcNow - startedAt).TotalSeconds);
+            CompletedAt: completedAt,
+            DurationSeconds: (int)(completedAt - startedAt).TotalSeconds);
 
         // Status rollup — the "approver heatmap"
-        var countsByStatus = topOps
-            .GroupBy(op => op.Status)
-            .ToDictionary(g => g.Key, g => g.Sum(op => op.Items.Count));
+        var countsByStatus = new Dictionary<string, int>();
+        foreach (var op in topOps)
+            countsByStatus[op.Status] = countsByStatus.GetValueOrDefault(op.Status) + op.Items.Count;
 
         var operations = new OperationsSummary(
             TotalIntents: intents.Count,
@@ -128,7 +138,7 @@ public sealed class ApproverSummaryGenerator
             RunId: runId,
             TenantId: tenantId,
             Mode: mode,
-            IssuedAt: DateTimeOffset.UtcNow,
+            IssuedAt: completedAt,
             Metadata: metadata,
             Scope: scope,
             Operations: operations,
@@ -147,7 +157,7 @@ public sealed class ApproverSummaryGenerator
         return val.ToString();
     }
 
-    private static ChangeItem BuildChangeItem(SideEffectIntent intent)
+    private static ChangeItem BuildChangeItem(SideEffectIntent intent, Dictionary<string, string> digestCache)
     {
         var issueType = ExtractParam(intent, "issue_type")
                         ?? (intent.BlockedByPolicy ? DeterminePolicyViolationType(intent) : "unknown");
@@ -161,12 +171,12 @@ public sealed class ApproverSummaryGenerator
 
         // Content digest from description text
         string? contentDigest = null;
-        if (!string.IsNullOrEmpty(description))
+        if (!string.IsNullOrEmpty(description) && !digestCache.TryGetValue(description, out contentDigest))
         {
             var bytes = Encoding.UTF8.GetBytes(description);
-            using var sha = SHA256.Create();
-            var hash = sha.ComputeHash(bytes);
-            contentDigest = "sha256:" + Convert.ToHexString(hash).ToLowerInvariant();
+            var hash = SHA256.HashData(bytes);
+            contentDigest = "sha256:" + Convert.ToHexStringLower(hash);
+            digestCache[description] = contentDigest;
         }
 
         // Structured details (e.g., missing README sections)
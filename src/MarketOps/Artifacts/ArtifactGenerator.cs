@@ -1,7 +1,6 @@
 using System;
 using System.Collections.Generic;
 using System.Security.Cryptography;
-using System.Text;
 using System.Text.Json;
 using MarketOps.Contracts;
 using MarketOps.Ports;
@@ -15,6 +14,12 @@ namespace MarketOps.Artifacts;
 /// </summary>
 public sealed class ArtifactGenerator
 {
+    // The policy set is fixed for this build, so its digest is computed once rather than per receipt
+    private static readonly ReceiptPolicySet PublicationPolicySet = new(
+        PolicySetId: "marketops.publication.v1",
+        Version: "1.0.0",
+        DigestSha256: FcSigner.ComputeSha256("marketops.publication.v1:1.0.0"));
+
     private readonly Action<string>? _auditLog;
 
     public ArtifactGenerator(Action<string>? auditLog = null)
@@ -88,7 +93,11 @@ public sealed class ArtifactGenerator
     {
         _auditLog?.Invoke($"ARTIFACT_ADVISORY_GENERATE run_id={runId} tenant={tenantId}");
 
-        var receiptId = $"advr_{Guid.NewGuid().ToString("N")[..8]}";
+        // 32 random bits rendered as exactly 8 hex chars — same ID space as the first
+        // 8 chars of a v4 GUID, without formatting 32 chars and slicing
+        Span<byte> receiptIdBytes = stackalloc byte[4];
+        RandomNumberGenerator.Fill(receiptIdBytes);
+        var receiptId = "advr_" + Convert.ToHexStringLower(receiptIdBytes);
         var issuedAt = DateTimeOffset.UtcNow;
 
         // Determine advisory outcome from reasons
@@ -96,11 +105,8 @@ public sealed class ArtifactGenerator
         var advisoryOutcome = hasPolicyViolation ? "denied" : "advisory";
 
         // Compute content digests
-        var planJson = FcSigner.ToCanonicalJson(plan);
-        var planSha256 = FcSigner.ComputeSha256(planJson);
-
-        var ledgerJson = FcSigner.ToCanonicalJson(ledger);
-        var ledgerSha256 = FcSigner.ComputeSha256(ledgerJson);
+        var planSha256 = FcSigner.ComputeCanonicalSha256(plan, ArtifactCanonicalJson.Options);
+        var ledgerSha256 = FcSigner.ComputeCanonicalSha256(ledger, ArtifactCanonicalJson.Options);
 
         // Build unsigned receipt body for self-hashing
         var unsignedReceipt = new JudgeAdvisoryReceipt(
@@ -119,21 +125,16 @@ public sealed class ArtifactGenerator
                 SubjectRef: $"run:{runId}",
                 TenantId: tenantId,
                 SubjectDigests: new ReceiptSubjectDigests(planSha256, ledgerSha256)),
-            PolicySet: new ReceiptPolicySet(
-                PolicySetId: "marketops.publication.v1",
-                Version: "1.0.0",
-                DigestSha256: FcSigner.ComputeSha256("marketops.publication.v1:1.0.0")),
+            PolicySet: PublicationPolicySet,
             Digests: new ReceiptDigests(ReceiptSha256: "pending"),
             Signature: new ReceiptSignature(Alg: "hmac-sha256", KeyId: signer.KeyId, Sig: "pending"));
 
         // Compute receipt self-hash (over unsigned body)
-        var unsignedJson = FcSigner.ToCanonicalJson(unsignedReceipt);
-        var receiptSha256 = FcSigner.ComputeSha256(unsignedJson);
+        var receiptSha256 = FcSigner.ComputeCanonicalSha256(unsignedReceipt, ArtifactCanonicalJson.Options);
 
         // Replace digest placeholder, then sign
         var withDigest = unsignedReceipt with { Digests = new ReceiptDigests(receiptSha256) };
-        var signingPayload = FcSigner.ToCanonicalJson(withDigest);
-        var sig = signer.Sign(signingPayload);
+        var sig = signer.Sign(FcSigner.ToCanonicalJsonBytes(withDigest, ArtifactCanonicalJson.Options));
 
         var signedReceipt = withDigest with
         {
@@ -149,11 +150,10 @@ public sealed class ArtifactGenerator
     /// </summary>
     public string ComputeDigest(object obj)
     {
-        var json = JsonSerializer.Serialize(obj);
-        var bytes = Encoding.UTF8.GetBytes(json);
-        using var sha = SHA256.Create();
-        var hash = sha.ComputeHash(bytes);
-        return Convert.ToHexString(hash).ToLowerInvariant();
+        // Hash the serializer's UTF-8 output directly; no intermediate string to re-encode
+        var bytes = JsonSerializer.SerializeToUtf8Bytes(obj);
+        var hash = SHA256.HashData(bytes);
+        return Convert.ToHexStringLower(hash);
     }
 }
 
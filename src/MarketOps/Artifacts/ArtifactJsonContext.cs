@@ -0,0 +1,50 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using System.Text.Json.Serialization.Metadata;
+using MarketOps.Security;
+
+namespace MarketOps.Artifacts;
+
+/// <summary>
+/// Compile-time generated JSON metadata for the artifact schema records.
+/// Serializer options resolve these types here instead of reflecting over
+/// them at runtime; anything not listed (e.g. object-typed payload members)
+/// falls back to the reflection resolver.
+/// The generation options (camelCase, omit nulls) match the indented file
+/// options in <see cref="ProofPackGenerator"/> and <see cref="FcBindingVerifier"/>,
+/// so those writes take the generated type-specialized path. The canonical
+/// signing and digest options set a relaxed encoder, which System.Text.Json
+/// treats as incompatible with the generated path; they use the generated
+/// metadata but still serialize through it property by property.
+/// </summary>
+[JsonSourceGenerationOptions(
+    PropertyNamingPolicy = JsonKnownNamingPolicy.CamelCase,
+    DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull)]
+[JsonSerializable(typeof(PublicationPlan))]
+[JsonSerializable(typeof(ProofLedger))]
+[JsonSerializable(typeof(JudgeAdvisoryReceipt))]
+[JsonSerializable(typeof(ApproverSummary))]
+[JsonSerializable(typeof(RunManifest))]
+[JsonSerializable(typeof(PackIndex))]
+[JsonSerializable(typeof(FcBindingResult))]
+internal sealed partial class ArtifactJsonContext : JsonSerializerContext
+{
+}
+
+/// <summary>
+/// Canonical JSON options for signing and digesting artifacts, resolving the
+/// artifact records through <see cref="ArtifactJsonContext"/>. Security stays
+/// unaware of artifact types; callers here pass these options to
+/// <see cref="FcSigner"/>.
+/// </summary>
+internal static class ArtifactCanonicalJson
+{
+    /// <summary>
+    /// The one resolver chain for artifact JSON — generated metadata first, reflection
+    /// for anything else — shared by the signing options and the on-disk file options.
+    /// </summary>
+    public static readonly IJsonTypeInfoResolver Resolver =
+        JsonTypeInfoResolver.Combine(ArtifactJsonContext.Default, new DefaultJsonTypeInfoResolver());
+
+    public static readonly JsonSerializerOptions Options = FcSigner.CreateCanonicalJsonOptions(Resolver);
+}
@@ -25,7 +25,8 @@ public sealed class FcBindingVerifier
     {
         PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
         DefaultIgnoreCondition = System.Text.Json.Serialization.JsonIgnoreCondition.WhenWritingNull,
-        WriteIndented = true
+        WriteIndented = true,
+        TypeInfoResolver = ArtifactCanonicalJson.Resolver
     };
 
     private readonly FcSigner _signer;
@@ -78,8 +79,7 @@ public sealed class FcBindingVerifier
             Actual: receipt.RunId));
 
         // Check 3: receipt.planSha256 == hash(plan)
-        var planJson = FcSigner.ToCanonicalJson(run.Plan);
-        var computedPlanHash = FcSigner.ComputeSha256(planJson);
+        var computedPlanHash = FcSigner.ComputeCanonicalSha256(run.Plan, ArtifactCanonicalJson.Options);
         var receiptPlanHash = receipt.Subject?.SubjectDigests?.PlanSha256 ?? "missing";
         var planHashMatch = computedPlanHash == receiptPlanHash;
         checks.Add(new FcBindingCheck(
@@ -92,8 +92,7 @@ public sealed class FcBindingVerifier
         // Check 4: receipt.ledgerSha256 (optional but ideal)
         // Strip ReceiptId/ReceiptDigest — receipt was signed against pre-binding ledger state
         var preBindingLedger = run.Ledger with { ReceiptId = null, ReceiptDigest = null };
-        var ledgerJson = FcSigner.ToCanonicalJson(preBindingLedger);
-        var computedLedgerHash = FcSigner.ComputeSha256(ledgerJson);
+        var computedLedgerHash = FcSigner.ComputeCanonicalSha256(preBindingLedger, ArtifactCanonicalJson.Options);
         var receiptLedgerHash = receipt.Subject?.SubjectDigests?.LedgerSha256;
         var ledgerHashMatch = receiptLedgerHash != null && computedLedgerHash == receiptLedgerHash;
         checks.Add(new FcBindingCheck(
@@ -112,7 +111,7 @@ public sealed class FcBindingVerifier
                 KeyId: receipt.Signature.KeyId,
                 Sig: "pending")
         };
-        var signingPayload = FcSigner.ToCanonicalJson(withDigestOnly);
+        var signingPayload = FcSigner.ToCanonicalJsonBytes(withDigestOnly, ArtifactCanonicalJson.Options);
         var sigValid = _signer.Verify(signingPayload, receipt.Signature.Sig);
         checks.Add(new FcBindingCheck(
             Id: "fc.signature.hmac",
@@ -154,6 +153,14 @@ public sealed class FcBindingVerifier
     private (string Json, string Markdown) BuildOutput(
         ProofPackRunInput run, List<FcBindingCheck> checks, bool allPassed)
     {
+        // Tally in one pass instead of re-walking the checks for each count
+        var passedChecks = 0;
+        foreach (var check in checks)
+        {
+            if (check.Passed)
+                passedChecks++;
+        }
+
         var result = new FcBindingResult(
             SchemaVersion: "marketops.fc-binding.v1",
             RunId: run.RunId,
@@ -161,8 +168,8 @@ public sealed class FcBindingVerifier
             VerifiedAt: DateTimeOffset.UtcNow,
             Verdict: allPassed ? "fc_bound" : "fc_binding_failed",
             TotalChecks: checks.Count,
-            PassedChecks: checks.Count(c => c.Passed),
-            FailedChecks: checks.Count(c => !c.Passed),
+            PassedChecks: passedChecks,
+            FailedChecks: checks.Count - passedChecks,
             Checks: checks);
 
         var json = JsonSerializer.Serialize(result, JsonOpts);
@@ -49,7 +49,8 @@ public sealed class ProofPackGenerator
     {
         PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
         DefaultIgnoreCondition = System.Text.Json.Serialization.JsonIgnoreCondition.WhenWritingNull,
-        WriteIndented = true
+        WriteIndented = true,
+        TypeInfoResolver = ArtifactCanonicalJson.Resolver
     };
 
     private readonly Action<string>? _auditLog;
@@ -72,8 +73,17 @@ public sealed class ProofPackGenerator
 
         Directory.CreateDirectory(outputDir);
 
+        // One clock read per pack: manifests, signatures, checklists and the index share it
+        var generatedAt = DateTimeOffset.UtcNow;
+
         var packRunEntries = new List<PackRunEntry>();
 
+        // Pack seal is streamed: each manifest hash is absorbed as soon as it is known,
+        // so the concatenated hash string is never materialized
+        using var packSeal = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+        // Manifest digests are 64 hex chars; encode each into this buffer instead of a fresh byte[]
+        Span<byte> manifestHashUtf8 = stackalloc byte[SHA256.HashSizeInBytes * 2];
+
         foreach (var run in runs.OrderBy(r => r.RunId))
         {
             var runDir = Path.Combine(outputDir, "runs", run.RunId);
@@ -100,28 +110,28 @@ public sealed class ProofPackGenerator
                     Name: "fc-binding.json",
                     Path: "verification/fc-binding.json",
                     ContentType: "application/json",
-                    Sha256: ComputeSha256Bytes(fcBytes),
+                    Sha256: FcSigner.ComputeSha256Bytes(fcBytes),
                     Bytes: fcBytes.Length));
                 _auditLog?.Invoke($"PROOFPACK_FC_BINDING run={run.RunId}");
             }
 
             // Build run manifest (without signature — signing payload excludes the signature block)
-            var unsignedManifest = BuildRunManifest(run, artifactEntries);
+            var unsignedManifest = BuildRunManifest(run, artifactEntries, generatedAt);
 
             // Ed25519 signing: sign canonical JSON of manifest WITHOUT manifestSignature
             RunManifest manifest;
             if (_ed25519Signer != null)
             {
                 // Canonical JSON for signing — excludes manifestSignature (which is null at this point)
-                var canonicalJson = FcSigner.ToCanonicalJson(unsignedManifest);
-                var base64Sig = _ed25519Signer.SignCanonical(canonicalJson);
+                // Signed as UTF-8 bytes directly; identical to encoding ToCanonicalJson's output
+                var base64Sig = _ed25519Signer.Sign(FcSigner.ToCanonicalJsonBytes(unsignedManifest, ArtifactCanonicalJson.Options));
 
                 var sigBlock = new ManifestSignature(
                     Alg: "ed25519",
                     KeyId: _ed25519Signer.KeyId,
                     PublicKeyPath: "keys/proofpack_signing_public.ed25519",
                     Signature: base64Sig,
-                    SignedAt: DateTimeOffset.UtcNow);
+                    SignedAt: generatedAt);
 
                 manifest = unsignedManifest with { ManifestSignature = sigBlock };
                 _auditLog?.Invoke($"PROOFPACK_ED25519_SIGNED run={run.RunId} keyId={_ed25519Signer.KeyId}");
@@ -132,13 +142,14 @@ public sealed class ProofPackGenerator
             }
 
             // Write RUN_MANIFEST.json (BOM-free)
-            var manifestJson = JsonSerializer.Serialize(manifest, JsonOpts);
-            var manifestBytes = Encoding.UTF8.GetBytes(manifestJson);
+            var manifestBytes = JsonSerializer.SerializeToUtf8Bytes(manifest, JsonOpts);
             var manifestPath = Path.Combine(runDir, "RUN_MANIFEST.json");
             File.WriteAllBytes(manifestPath, manifestBytes);
 
-            var manifestHash = ComputeSha256Bytes(manifestBytes);
+            var manifestHash = FcSigner.ComputeSha256Bytes(manifestBytes);
             _auditLog?.Invoke($"PROOFPACK_RUN_MANIFEST run={run.RunId} sha256={manifestHash}");
+            Encoding.UTF8.GetBytes(manifestHash, manifestHashUtf8);
+            packSeal.AppendData(manifestHashUtf8);
 
             packRunEntries.Add(new PackRunEntry(
                 RunId: run.RunId,
@@ -154,9 +165,8 @@ public sealed class ProofPackGenerator
 
         // Compute deterministic pack seal
         // Rule: sort runs by runId ascending, concat manifest sha256 strings (no separators), SHA-256 the result
-        var sortedEntries = packRunEntries.OrderBy(e => e.RunId).ToList();
-        var concatHashes = string.Concat(sortedEntries.Select(e => e.Sha256));
-        var packSha256 = ComputeSha256(concatHashes);
+        // Runs are visited in runId order above, so packSeal has absorbed the hashes in seal order
+        var packSha256 = Convert.ToHexStringLower(packSeal.GetHashAndReset());
 
         // Single-tenant rule: all runs must share the same tenantId
         var packTenantId = runs.First().TenantId;
@@ -167,15 +177,14 @@ public sealed class ProofPackGenerator
 
         var packIndex = new PackIndex(
             SchemaVersion: "marketops.proofpack.index.v1",
-            CreatedAt: DateTimeOffset.UtcNow,
-            PackId: $"pack-{DateTimeOffset.UtcNow:yyyyMMdd-HHmmss}",
+            CreatedAt: generatedAt,
+            PackId: $"pack-{generatedAt:yyyyMMdd-HHmmss}",
             TenantId: packTenantId,
-            Runs: sortedEntries,
+            Runs: packRunEntries,
             PackSha256: packSha256);
 
         // Write PACK_INDEX.json (BOM-free)
-        var packIndexJson = JsonSerializer.Serialize(packIndex, JsonOpts);
-        var packIndexBytes = Encoding.UTF8.GetBytes(packIndexJson);
+        var packIndexBytes = JsonSerializer.SerializeToUtf8Bytes(packIndex, JsonOpts);
         File.WriteAllBytes(Path.Combine(outputDir, "PACK_INDEX.json"), packIndexBytes);
 
         // Ship public key with the pack
@@ -213,7 +222,7 @@ public sealed class ProofPackGenerator
             Name: "approver-summary.md",
             Path: $"artifacts/approver-summary.md",
             ContentType: "text/markdown",
-            Sha256: ComputeSha256Bytes(mdBytes),
+            Sha256: FcSigner.ComputeSha256Bytes(mdBytes),
             Bytes: mdBytes.Length));
 
         return entries;
@@ -221,21 +230,21 @@ public sealed class ProofPackGenerator
 
     private ArtifactEntry WriteJsonArtifact(string dir, string filename, object artifact)
     {
-        var json = JsonSerializer.Serialize(artifact, JsonOpts);
-        var bytes = Encoding.UTF8.GetBytes(json);
+        // Serialize straight to UTF-8 — no intermediate string, and no BOM
+        var bytes = JsonSerializer.SerializeToUtf8Bytes(artifact, artifact.GetType(), JsonOpts);
         File.WriteAllBytes(Path.Combine(dir, filename), bytes);
 
         return new ArtifactEntry(
             Name: filename,
             Path: $"artifacts/{filename}",
             ContentType: "application/json",
-            Sha256: ComputeSha256Bytes(bytes),
+            Sha256: FcSigner.ComputeSha256Bytes(bytes),
             Bytes: bytes.Length);
     }
 
     // ── Manifest Building ────────────────────────────────────────────
 
-    private RunManifest BuildRunManifest(ProofPackRunInput run, List<ArtifactEntry> artifacts)
+    private RunManifest BuildRunManifest(ProofPackRunInput run, List<ArtifactEntry> artifacts, DateTimeOffset issuedAt)
     {
         var summary = run.Summary;
 
@@ -243,7 +252,7 @@ public sealed class ProofPackGenerator
             SchemaVersion: "marketops.proofpack.run-manifest.v1.3",
             RunId: run.RunId,
             TenantId: run.TenantId,
-            IssuedAt: DateTimeOffset.UtcNow,
+            IssuedAt: issuedAt,
             Mode: run.Mode,
             Scenario: run.Scenario,
             Source: new SourceInfo(
@@ -279,7 +288,7 @@ public sealed class ProofPackGenerator
         sb.AppendLine($"**Run ID:** `{run.RunId}`");
         sb.AppendLine($"**Scenario:** {run.Scenario}");
         sb.AppendLine($"**Mode:** {run.Mode}");
-        sb.AppendLine($"**Generated:** {DateTimeOffset.UtcNow:O}");
+        sb.AppendLine($"**Generated:** {manifest.IssuedAt:O}");
         sb.AppendLine();
         sb.AppendLine("## Invariant Checks");
         sb.AppendLine();
@@ -343,20 +352,5 @@ public sealed class ProofPackGenerator
 
         return sb.ToString();
     }
-
-    // ── Hashing ──────────────────────────────────────────────────────
-
-    private static string ComputeSha256(string text)
-    {
-        var bytes = Encoding.UTF8.GetBytes(text);
-        return ComputeSha256Bytes(bytes);
-    }
-
-    private static string ComputeSha256Bytes(byte[] bytes)
-    {
-        using var sha = SHA256.Create();
-        var hash = sha.ComputeHash(bytes);
-        return Convert.ToHexString(hash).ToLowerInvariant();
-    }
 }
 
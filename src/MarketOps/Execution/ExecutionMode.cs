@@ -5,3 +5,9 @@ public enum ExecutionMode
     DryRun,
     Prod
 }
+
+public static class ExecutionModeExtensions
+{
+    public static bool IsDefined(this ExecutionMode mode) =>
+        mode is ExecutionMode.DryRun or ExecutionMode.Prod;
+}
@@ -1,7 +1,6 @@
 using System;
 using System.Collections.Concurrent;
 using System.Collections.Generic;
-using System.Linq;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -29,6 +28,7 @@ public sealed class InMemorySideEffectIntentStore : ISideEffectIntentStore
         if (!_byRunId.TryGetValue(runId, out var queue))
             return Task.FromResult<IReadOnlyList<SideEffectIntent>>(Array.Empty<SideEffectIntent>());
 
-        return Task.FromResult<IReadOnlyList<SideEffectIntent>>(queue.ToArray().ToList());
+        // The array is already an independent snapshot; no need to copy it again into a list
+        return Task.FromResult<IReadOnlyList<SideEffectIntent>>(queue.ToArray());
     }
 }
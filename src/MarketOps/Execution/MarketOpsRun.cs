@@ -10,7 +10,7 @@ public sealed record MarketOpsRun(
 {
     public void EnsureModeIsPresent()
     {
-        if (!Enum.IsDefined(Mode))
+        if (!Mode.IsDefined())
             throw new InvalidOperationException("MarketOps run mode is missing or invalid.");
     }
 }
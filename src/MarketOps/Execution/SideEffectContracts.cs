@@ -35,7 +35,7 @@ public sealed record SideEffectIntent(
 {
     public void ValidateFailClosed()
     {
-        if (!Enum.IsDefined(Mode))
+        if (!Mode.IsDefined())
             throw new InvalidOperationException("SideEffectIntent.mode is required.");
 
         if (Mode == ExecutionMode.DryRun && !BlockedByMode)
@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Frozen;
 using System.Collections.Generic;
 using System.Linq;
 
@@ -131,8 +132,44 @@ public sealed record MarketOpsGateConfig(
         return config;
     }
 
-    public bool IsDestinationAllowed(string destination)
-        => Allowlist.Contains(destination, StringComparer.Ordinal);
+    // The allowlist is snapshotted at construction (and on `with`), and its lookup set is
+    // built alongside it, so later changes to the caller's list can't leave the two out of step
+    private readonly IReadOnlyList<string> _allowlist = SnapshotAllowlist(Allowlist);
+    private readonly FrozenSet<string> _allowlistSet = BuildAllowlistSet(Allowlist);
+
+    public IReadOnlyList<string> Allowlist
+    {
+        get => _allowlist;
+        init
+        {
+            _allowlist = SnapshotAllowlist(value);
+            _allowlistSet = BuildAllowlistSet(value);
+        }
+    }
+
+    public bool IsDestinationAllowed(string destination) => _allowlistSet.Contains(destination);
+
+    /// <summary>
+    /// Returns the destinations that are not allowlisted, or null when all are allowed.
+    /// The allowed case is the common one, so the list is only created on the first denial.
+    /// </summary>
+    public List<string>? FindDeniedDestinations(IEnumerable<string> destinations)
+    {
+        List<string>? denied = null;
+        foreach (var destination in destinations)
+        {
+            if (!_allowlistSet.Contains(destination))
+                (denied ??= new List<string>()).Add(destination);
+        }
+
+        return denied;
+    }
+
+    private static IReadOnlyList<string> SnapshotAllowlist(IReadOnlyList<string>? allowlist)
+        => allowlist == null ? null! : Array.AsReadOnly(allowlist.ToArray());
+
+    private static FrozenSet<string> BuildAllowlistSet(IReadOnlyList<string>? allowlist)
+        => allowlist == null ? FrozenSet<string>.Empty : allowlist.ToFrozenSet(StringComparer.Ordinal);
 
     public void Validate()
     {
@@ -158,13 +158,17 @@ public sealed class PipelineStages
         var policies = new List<string>();
         var evaluator = new PolicyEvaluator(_auditLog);
 
+        // Every intent in this stage shares one mode string and one timestamp
+        var intentMode = run.Mode == ExecutionMode.DryRun ? "dry_run" : "prod";
+        var evaluatedAt = DateTimeOffset.UtcNow;
+
         // Generate intents from verified candidates
         var intents = new List<SideEffectIntent>();
         foreach (var candidate in verified.Candidates)
         {
             var intent = new SideEffectIntent(
                 Id: Guid.NewGuid().ToString(),
-                Mode: run.Mode == ExecutionMode.DryRun ? "dry_run" : "prod",
+                Mode: intentMode,
                 EffectType: SideEffectType.OpenPr,
                 Target: candidate.RepoPath ?? "unknown",
                 Parameters: new Dictionary<string, object?>
@@ -178,7 +182,7 @@ public sealed class PipelineStages
                 BlockedByPolicy: false,
                 PolicyDenialReasons: new List<string>(),
                 RequiredAuthorization: new Dictionary<string, object?> { { "enforceable_required", false } },
-                Timestamp: DateTimeOffset.UtcNow);
+                Timestamp: evaluatedAt);
 
             intents.Add(intent);
         }
@@ -197,7 +201,7 @@ public sealed class PipelineStages
             {
                 var violationIntent = new SideEffectIntent(
                     Id: Guid.NewGuid().ToString(),
-                    Mode: run.Mode == ExecutionMode.DryRun ? "dry_run" : "prod",
+                    Mode: intentMode,
                     EffectType: SideEffectType.TagRepo,  // Not OpenPr → triggers direct-push-to-main policy
                     Target: "D:\\Repos\\marketops\\main",  // Target main branch
                     Parameters: new Dictionary<string, object?>
@@ -212,7 +216,7 @@ public sealed class PipelineStages
                     BlockedByPolicy: false,
                     PolicyDenialReasons: new List<string>(),
                     RequiredAuthorization: new Dictionary<string, object?> { { "enforceable_required", false } },
-                    Timestamp: DateTimeOffset.UtcNow);
+                    Timestamp: evaluatedAt);
 
                 intents.Add(violationIntent);
                 _auditLog?.Invoke($"VIOLATION_INJECTED type=direct_push_main intent_id={violationIntent.Id}");
@@ -229,8 +233,8 @@ public sealed class PipelineStages
             for (int i = 0; i < intents.Count; i++)
             {
                 var intent = intents[i];
-                // Check if this specific intent was denied
-                var denialReason = policyResult.DenialReasons.FirstOrDefault(r => r.Contains(intent.Id));
+                // Check if this specific intent was denied (one lookup, not a scan of every reason)
+                var denialReason = policyResult.FirstDenialByIntentId.GetValueOrDefault(intent.Id);
                 if (denialReason != null)
                 {
                     intents[i] = intent with
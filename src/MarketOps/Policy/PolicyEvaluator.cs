@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Frozen;
 using System.Collections.Generic;
 using System.Linq;
 using System.Threading;
@@ -15,6 +16,10 @@ namespace MarketOps.Policy;
 /// </summary>
 public sealed class PolicyEvaluator
 {
+    // Built once; case-insensitive lookup replaces lowercasing the action on every intent
+    private static readonly FrozenSet<string> CiWeakeningActions =
+        new[] { "remove", "weaken", "disable" }.ToFrozenSet(StringComparer.OrdinalIgnoreCase);
+
     private readonly Action<string>? _auditLog;
 
     public PolicyEvaluator(Action<string>? auditLog = null)
@@ -33,20 +38,25 @@ public sealed class PolicyEvaluator
         _auditLog?.Invoke($"POLICY_EVAL_START intent_count={intents.Count}");
 
         var denialReasons = new List<string>();
+        var firstDenialByIntent = new Dictionary<string, string>(StringComparer.Ordinal);
 
         foreach (var intent in intents)
         {
             // Check for direct push to main
             if (IsDirectPushToMain(intent))
             {
-                denialReasons.Add($"Intent {intent.Id} targets direct push to main (blocked by policy)");
+                var reason = $"Intent {intent.Id} targets direct push to main (blocked by policy)";
+                denialReasons.Add(reason);
+                firstDenialByIntent.TryAdd(intent.Id, reason);
                 _auditLog?.Invoke($"POLICY_DENY intent_id={intent.Id} reason=direct_push_to_main");
             }
 
             // Check for CI weakening
             if (WeakensCi(intent))
             {
-                denialReasons.Add($"Intent {intent.Id} weakens CI/workflow permissions (blocked by policy)");
+                var reason = $"Intent {intent.Id} weakens CI/workflow permissions (blocked by policy)";
+                denialReasons.Add(reason);
+                firstDenialByIntent.TryAdd(intent.Id, reason);
                 _auditLog?.Invoke($"POLICY_DENY intent_id={intent.Id} reason=weakens_ci");
             }
         }
@@ -56,33 +66,24 @@ public sealed class PolicyEvaluator
 
         return new PolicyEvaluationResult(
             IsApproved: isApproved,
-            DenialReasons: denialReasons);
+            DenialReasons: denialReasons,
+            FirstDenialByIntentId: firstDenialByIntent);
     }
 
     private bool IsDirectPushToMain(SideEffectIntent intent)
     {
-        // Check if target contains "main" and effect type is not OpenPr
+        // Opening a PR is never a direct push, whatever it targets; decide on the
+        // effect type before scanning the target or parameters
+        if (intent.EffectType == SideEffectType.OpenPr)
+            return false;
+
+        // Check if target contains "main"
         if (intent.Target.Contains("main", StringComparison.OrdinalIgnoreCase))
-        {
-            if (intent.EffectType != SideEffectType.OpenPr)
-            {
-                return true;
-            }
-        }
+            return true;
 
         // Check parameters for branch targeting
-        if (intent.Parameters.TryGetValue("branch", out var branch))
-        {
-            if (branch?.ToString()?.Equals("main", StringComparison.OrdinalIgnoreCase) == true)
-            {
-                if (intent.EffectType != SideEffectType.OpenPr)
-                {
-                    return true;
-                }
-            }
-        }
-
-        return false;
+        return intent.Parameters.TryGetValue("branch", out var branch)
+            && branch?.ToString()?.Equals("main", StringComparison.OrdinalIgnoreCase) == true;
     }
 
     private bool WeakensCi(SideEffectIntent intent)
@@ -93,8 +94,8 @@ public sealed class PolicyEvaluator
             // Check if parameters indicate removal or weakening
             if (intent.Parameters.TryGetValue("action", out var action))
             {
-                var actionStr = action?.ToString()?.ToLowerInvariant();
-                if (actionStr == "remove" || actionStr == "weaken" || actionStr == "disable")
+                var actionStr = action?.ToString();
+                if (actionStr != null && CiWeakeningActions.Contains(actionStr))
                 {
                     return true;
                 }
@@ -107,8 +108,11 @@ public sealed class PolicyEvaluator
 
 /// <summary>
 /// Result of policy evaluation.
+/// FirstDenialByIntentId maps each denied intent to its first denial reason,
+/// so callers don't have to search DenialReasons per intent.
 /// </summary>
 public sealed record PolicyEvaluationResult(
     bool IsApproved,
-    List<string> DenialReasons);
+    List<string> DenialReasons,
+    IReadOnlyDictionary<string, string> FirstDenialByIntentId);
 
@@ -16,6 +16,21 @@ public enum SideEffectType
     OpenPr = 3
 }
 
+/// <summary>
+/// Precomputed names for <see cref="SideEffectType"/> (same text as ToString, no per-call formatting).
+/// </summary>
+public static class SideEffectTypeExtensions
+{
+    public static string ToName(this SideEffectType effectType) => effectType switch
+    {
+        SideEffectType.PublishRelease => nameof(SideEffectType.PublishRelease),
+        SideEffectType.PublishPost => nameof(SideEffectType.PublishPost),
+        SideEffectType.TagRepo => nameof(SideEffectType.TagRepo),
+        SideEffectType.OpenPr => nameof(SideEffectType.OpenPr),
+        _ => effectType.ToString()
+    };
+}
+
 /// <summary>
 /// Records intent to perform a side effect.
 /// In dry_run: always blocked, intent recorded.
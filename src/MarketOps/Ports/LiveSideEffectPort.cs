@@ -67,28 +67,22 @@ public sealed class LiveSideEffectPort : ISideEffectPort
     {
         var intentId = Guid.NewGuid().ToString();
         var now = DateTimeOffset.UtcNow;
+        var effectName = effectType.ToName();
 
         // Validate authorization (fail-closed)
         var authResult = await _authValidator.ValidateAsync(
-            effectType.ToString(), target, parameters, ct);
+            effectName, target, parameters, ct);
 
         if (!authResult.IsAuthorized)
         {
             _auditLog?.Invoke(
-                $"SIDE_EFFECT_DENIED mode=prod effect={effectType} target={target} reason={authResult.DenyReason}");
-
-            return new SideEffectReceipt(
-                Id: intentId,
-                Mode: "prod",
-                EffectType: effectType,
-                Target: target,
-                Success: false,
-                ErrorMessage: authResult.DenyReason,
-                ExecutedAt: now);
+                $"SIDE_EFFECT_DENIED mode=prod effect={effectName} target={target} reason={authResult.DenyReason}");
+
+            return Receipt(success: false, authResult.DenyReason);
         }
 
         // Execute side effect
-        _auditLog?.Invoke($"SIDE_EFFECT_EXECUTING mode=prod effect={effectType} target={target}");
+        _auditLog?.Invoke($"SIDE_EFFECT_EXECUTING mode=prod effect={effectName} target={target}");
 
         try
         {
@@ -96,30 +90,26 @@ public sealed class LiveSideEffectPort : ISideEffectPort
             // This is a placeholder for the actual implementation
             await Task.Delay(0, ct);
 
-            _auditLog?.Invoke($"SIDE_EFFECT_SUCCESS mode=prod effect={effectType} target={target}");
+            _auditLog?.Invoke($"SIDE_EFFECT_SUCCESS mode=prod effect={effectName} target={target}");
 
-            return new SideEffectReceipt(
-                Id: intentId,
-                Mode: "prod",
-                EffectType: effectType,
-                Target: target,
-                Success: true,
-                ErrorMessage: null,
-                ExecutedAt: now);
+            return Receipt(success: true, errorMessage: null);
         }
         catch (Exception ex)
         {
-            _auditLog?.Invoke($"SIDE_EFFECT_FAILED mode=prod effect={effectType} target={target} error={ex.Message}");
-
-            return new SideEffectReceipt(
-                Id: intentId,
-                Mode: "prod",
-                EffectType: effectType,
-                Target: target,
-                Success: false,
-                ErrorMessage: ex.Message,
-                ExecutedAt: now);
+            _auditLog?.Invoke($"SIDE_EFFECT_FAILED mode=prod effect={effectName} target={target} error={ex.Message}");
+
+            return Receipt(success: false, ex.Message);
         }
+
+        // Denied, succeeded and failed outcomes differ only in status and error
+        SideEffectReceipt Receipt(bool success, string? errorMessage) => new(
+            Id: intentId,
+            Mode: "prod",
+            EffectType: effectType,
+            Target: target,
+            Success: success,
+            ErrorMessage: errorMessage,
+            ExecutedAt: now);
     }
 }
 
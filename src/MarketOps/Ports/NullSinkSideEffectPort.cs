@@ -79,7 +79,7 @@ public sealed class NullSinkSideEffectPort : ISideEffectPort
             Timestamp: now);
 
         _recordedIntents.Add(intent);
-        _auditLog?.Invoke($"SIDE_EFFECT_BLOCKED mode=dry_run effect={effectType} target={target}");
+        _auditLog?.Invoke($"SIDE_EFFECT_BLOCKED mode=dry_run effect={effectType.ToName()} target={target}");
 
         // Return blocked receipt
         var receipt = new SideEffectReceipt(
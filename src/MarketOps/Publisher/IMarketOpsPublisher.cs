@@ -1,6 +1,5 @@
 using System;
 using System.Collections.Generic;
-using System.Linq;
 using System.Threading;
 using System.Threading.Tasks;
 using MarketOps.Contracts;
@@ -27,8 +26,8 @@ public sealed class AllowlistPublisherGuard
         if (destinations == null || destinations.Count == 0)
             throw new ArgumentException("Destinations cannot be empty", nameof(destinations));
 
-        var denied = destinations.Where(d => !_config.IsDestinationAllowed(d)).ToList();
-        if (denied.Count > 0)
+        var denied = _config.FindDeniedDestinations(destinations);
+        if (denied != null)
             throw new InvalidOperationException($"Destination not allowed: {string.Join(", ", denied)}");
     }
 }
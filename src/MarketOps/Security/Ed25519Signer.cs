@@ -124,9 +124,8 @@ public sealed class Ed25519Signer : IDisposable
     /// </summary>
     public static string ComputeFingerprint(byte[] publicKeyBytes)
     {
-        using var sha = SHA256.Create();
-        var hash = sha.ComputeHash(publicKeyBytes);
-        var fullHex = Convert.ToHexString(hash).ToLowerInvariant();
+        var hash = SHA256.HashData(publicKeyBytes);
+        var fullHex = Convert.ToHexStringLower(hash);
         return fullHex[..16];
     }
 
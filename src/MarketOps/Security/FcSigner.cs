@@ -1,7 +1,10 @@
 using System;
+using System.Buffers;
+using System.Runtime.InteropServices;
 using System.Security.Cryptography;
 using System.Text;
 using System.Text.Json;
+using System.Text.Json.Serialization.Metadata;
 
 namespace MarketOps.Security;
 
@@ -17,6 +20,38 @@ public sealed class FcSigner
     private const string DevKey = "marketops-fc-dev-signing-key-v1-NOT-FOR-PRODUCTION";
     private const string Algorithm = "hmac-sha256";
 
+    // System.Text.Json doesn't sort keys by default, but for our use case
+    // we serialize with camelCase and no indentation for determinism.
+    // True JCS (RFC 8785) would require a dedicated library, but for
+    // HMAC signing within our own system this is sufficient.
+    // Shared so the per-type serialization metadata is built once, not per call.
+    // Callers with generated metadata for their types pass options built by
+    // CreateCanonicalJsonOptions instead; the output bytes are the same.
+    private static readonly JsonSerializerOptions CanonicalJsonOpts = new()
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+        DefaultIgnoreCondition = System.Text.Json.Serialization.JsonIgnoreCondition.WhenWritingNull,
+        WriteIndented = false,
+        Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping,
+        TypeInfoResolver = new DefaultJsonTypeInfoResolver()
+    };
+
+    // Writing through a Utf8JsonWriter uses the writer's options, not the serializer's,
+    // so the output-affecting canonical settings are carried over from CanonicalJsonOpts
+    private static readonly JsonWriterOptions CanonicalWriterOptions = new()
+    {
+        Encoder = CanonicalJsonOpts.Encoder,
+        Indented = CanonicalJsonOpts.WriteIndented
+    };
+
+    // Per-thread scratch for canonical-JSON hashing: the serialized bytes are only
+    // hashed and dropped, so they are written into a reused buffer, not a new byte[].
+    // A buffer that grew past the cap is released so an occasional large payload
+    // isn't pinned on every pool thread for the process lifetime.
+    private const int MaxRetainedCanonicalBufferBytes = 64 * 1024;
+    [ThreadStatic] private static ArrayBufferWriter<byte>? t_canonicalBuffer;
+    [ThreadStatic] private static Utf8JsonWriter? t_canonicalWriter;
+
     private readonly byte[] _keyBytes;
     private readonly string _keyId;
     private readonly string _issuerId;
@@ -45,14 +80,21 @@ public sealed class FcSigner
 
     /// <summary>
     /// Computes HMAC-SHA256 signature over canonical JSON bytes.
-    /// Canonical form: sorted-key JSON with no indentation (deterministic).
+    /// Canonical form: properties in record declaration order, no indentation (deterministic).
     /// </summary>
     public string Sign(string canonicalJson)
     {
-        var payloadBytes = Encoding.UTF8.GetBytes(canonicalJson);
-        using var hmac = new HMACSHA256(_keyBytes);
-        var hash = hmac.ComputeHash(payloadBytes);
-        return Convert.ToHexString(hash).ToLowerInvariant();
+        return Sign(Encoding.UTF8.GetBytes(canonicalJson));
+    }
+
+    /// <summary>
+    /// Computes HMAC-SHA256 signature over canonical JSON that is already UTF-8 encoded
+    /// (see <see cref="ToCanonicalJsonBytes"/>), skipping the string round-trip.
+    /// </summary>
+    public string Sign(byte[] canonicalJsonUtf8)
+    {
+        var hash = HMACSHA256.HashData(_keyBytes, canonicalJsonUtf8);
+        return Convert.ToHexStringLower(hash);
     }
 
     /// <summary>
@@ -60,10 +102,25 @@ public sealed class FcSigner
     /// </summary>
     public bool Verify(string canonicalJson, string signature)
     {
-        var expected = Sign(canonicalJson);
+        return Verify(Encoding.UTF8.GetBytes(canonicalJson), signature);
+    }
+
+    /// <summary>
+    /// Verifies an HMAC-SHA256 signature against UTF-8 canonical JSON bytes.
+    /// </summary>
+    public bool Verify(byte[] canonicalJsonUtf8, string signature)
+    {
+        // MAC and its lowercase hex form stay on the stack; no signature string or
+        // UTF-8 copies are built just to be compared and dropped
+        Span<byte> mac = stackalloc byte[HMACSHA256.HashSizeInBytes];
+        HMACSHA256.HashData(_keyBytes, canonicalJsonUtf8, mac);
+
+        Span<char> expected = stackalloc char[mac.Length * 2];
+        Convert.TryToHexStringLower(mac, expected, out _);
+
         return CryptographicOperations.FixedTimeEquals(
-            Encoding.UTF8.GetBytes(expected),
-            Encoding.UTF8.GetBytes(signature));
+            MemoryMarshal.AsBytes(expected),
+            MemoryMarshal.AsBytes(signature.AsSpan()));
     }
 
     /// <summary>
@@ -80,29 +137,64 @@ public sealed class FcSigner
     /// </summary>
     public static string ComputeSha256Bytes(byte[] bytes)
     {
-        using var sha = SHA256.Create();
-        var hash = sha.ComputeHash(bytes);
-        return Convert.ToHexString(hash).ToLowerInvariant();
+        var hash = SHA256.HashData(bytes);
+        return Convert.ToHexStringLower(hash);
     }
 
     /// <summary>
-    /// Serializes an object to canonical JSON (sorted keys, no indentation).
+    /// Creates canonical JSON options that resolve type metadata through
+    /// <paramref name="resolver"/> (e.g. a source-generated context), keeping the
+    /// canonical naming, null handling and escaping.
+    /// </summary>
+    public static JsonSerializerOptions CreateCanonicalJsonOptions(IJsonTypeInfoResolver resolver)
+    {
+        return new JsonSerializerOptions(CanonicalJsonOpts) { TypeInfoResolver = resolver };
+    }
+
+    /// <summary>
+    /// Computes SHA-256 of an object's canonical JSON — the same digest as
+    /// <c>ComputeSha256Bytes(ToCanonicalJsonBytes(obj))</c> — serializing into a
+    /// per-thread scratch buffer instead of allocating the payload.
+    /// </summary>
+    public static string ComputeCanonicalSha256(object obj, JsonSerializerOptions? options = null)
+    {
+        var buffer = t_canonicalBuffer ??= new ArrayBufferWriter<byte>(1024);
+        buffer.ResetWrittenCount();
+
+        var writer = t_canonicalWriter ??= new Utf8JsonWriter(buffer, CanonicalWriterOptions);
+        writer.Reset(buffer);
+
+        JsonSerializer.Serialize(writer, obj, obj.GetType(), options ?? CanonicalJsonOpts);
+        writer.Flush();
+
+        Span<byte> hash = stackalloc byte[SHA256.HashSizeInBytes];
+        SHA256.HashData(buffer.WrittenSpan, hash);
+
+        if (buffer.Capacity > MaxRetainedCanonicalBufferBytes)
+        {
+            t_canonicalBuffer = null;
+            t_canonicalWriter = null;
+        }
+
+        return Convert.ToHexStringLower(hash);
+    }
+
+    /// <summary>
+    /// Serializes an object to canonical JSON (declaration-order keys, no indentation).
     /// Used as the signing payload for deterministic signatures.
     /// </summary>
     public static string ToCanonicalJson(object obj)
     {
-        // System.Text.Json doesn't sort keys by default, but for our use case
-        // we serialize with camelCase and no indentation for determinism.
-        // True JCS (RFC 8785) would require a dedicated library, but for
-        // HMAC signing within our own system this is sufficient.
-        var opts = new JsonSerializerOptions
-        {
-            PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
-            DefaultIgnoreCondition = System.Text.Json.Serialization.JsonIgnoreCondition.WhenWritingNull,
-            WriteIndented = false,
-            Encoder = System.Text.Encodings.Web.JavaScriptEncoder.UnsafeRelaxedJsonEscaping
-        };
-        return JsonSerializer.Serialize(obj, opts);
+        return JsonSerializer.Serialize(obj, CanonicalJsonOpts);
+    }
+
+    /// <summary>
+    /// Serializes an object to canonical JSON as UTF-8 bytes — the exact bytes
+    /// <see cref="ToCanonicalJson"/> would encode to, without the intermediate string.
+    /// </summary>
+    public static byte[] ToCanonicalJsonBytes(object obj, JsonSerializerOptions? options = null)
+    {
+        return JsonSerializer.SerializeToUtf8Bytes(obj, options ?? CanonicalJsonOpts);
     }
 }
 
@@ -13,7 +13,7 @@ namespace Omega.Sdk;
 /// Produces stable byte representations and hashes across machines.
 ///
 /// Rules:
-/// - Sorted property names (ordinal comparison)
+/// - Property names in declaration order (fixed by the contract types, no sort pass)
 /// - UTF-8 encoding
 /// - No whitespace variance
 /// - ISO 8601 UTC for DateTimeOffset
@@ -42,14 +42,11 @@ public static class Canonicalizer
             return Array.Empty<byte>();
         }
 
-        // Serialize to JSON with deterministic ordering
-        string json = JsonSerializer.Serialize(value, s_options);
-
-        // Sort JSON keys to ensure determinism
-        // For complex objects, we rely on JsonSerializer's stable output
-        // with PropertyNamingPolicy and sorted properties
-
-        return Encoding.UTF8.GetBytes(json);
+        // Serialize straight to UTF-8, producing the same bytes as encoding the JSON
+        // string without allocating the string. Keys are not sorted at write time;
+        // JsonSerializer emits properties in declaration order, which is stable for
+        // the contract types we hash.
+        return JsonSerializer.SerializeToUtf8Bytes(value, s_options);
     }
 
     /// <summary>
@@ -62,13 +59,12 @@ public static class Canonicalizer
             return string.Empty;
         }
 
-        using var sha256 = SHA256.Create();
-        byte[] hashBytes = sha256.ComputeHash(bytes);
+        // One-shot static hash: no per-call algorithm instance, and the
+        // platform crypto provider uses hardware SHA extensions when present
+        byte[] hashBytes = SHA256.HashData(bytes);
 
         // Convert to lowercase hex
-        return BitConverter.ToString(hashBytes)
-            .Replace("-", string.Empty)
-            .ToLowerInvariant();
+        return Convert.ToHexStringLower(hashBytes);
     }
 
     /// <summary>
@@ -1,8 +1,10 @@
 using System;
 using System.Collections.Generic;
+using System.Security.Cryptography;
 using System.Threading.Tasks;
 using MarketOps.Artifacts;
 using MarketOps.Contracts;
+using MarketOps.Pipeline;
 using MarketOps.Ports;
 using MarketOps.Security;
 using Xunit;
@@ -73,6 +75,75 @@ public sealed class DryRunLawTests
         Assert.Equal(runId, advisory.RunId);
     }
 
+    [Fact]
+    public void AdvisoryReceipt_SignatureVerifiesAndRejectsTampering()
+    {
+        // Arrange
+        var generator = new ArtifactGenerator();
+        var runId = "test-run-sig";
+        var plan = generator.GeneratePublicationPlan(
+            runId, "tenant-test", ExecutionMode.DryRun,
+            new List<object>(), new List<object>(), new Dictionary<string, string>());
+        var ledger = generator.GenerateProofLedger(
+            runId, "tenant-test", ExecutionMode.DryRun,
+            new List<SideEffectIntent>(), new List<SideEffectReceipt>());
+        var signer = new FcSigner();
+        var advisory = generator.GenerateAdvisoryReceipt(
+            runId, "tenant-test", new List<string> { "reason1" }, plan, ledger, signer);
+
+        // Act — rebuild the signing payload (signature placeholder restored)
+        var payload = FcSigner.ToCanonicalJsonBytes(
+            advisory with { Signature = advisory.Signature with { Sig = "pending" } });
+        var sig = advisory.Signature.Sig;
+
+        // Assert
+        Assert.True(signer.Verify(payload, sig));
+        Assert.True(signer.Verify(FcSigner.ToCanonicalJson(
+            advisory with { Signature = advisory.Signature with { Sig = "pending" } }), sig));
+        Assert.False(signer.Verify(payload, sig.ToUpperInvariant()));
+        Assert.False(signer.Verify(payload, sig[..^1]));
+        Assert.False(signer.Verify(payload, (sig[0] == 'a' ? "b" : "a") + sig[1..]));
+        Assert.False(new FcSigner(hmacKey: "other-key").Verify(payload, sig));
+    }
+
+    [Fact]
+    public void AdvisoryReceipt_SubjectDigestsMatchCanonicalBytes()
+    {
+        // Arrange
+        var generator = new ArtifactGenerator();
+        var runId = Guid.NewGuid().ToString();
+        var plan = generator.GeneratePublicationPlan(
+            runId, "tenant-test", ExecutionMode.DryRun,
+            new List<object>(), new List<object>(), new Dictionary<string, string>());
+        var ledger = generator.GenerateProofLedger(
+            runId, "tenant-test", ExecutionMode.DryRun,
+            new List<SideEffectIntent>(), new List<SideEffectReceipt>());
+
+        // Act
+        var advisory = generator.GenerateAdvisoryReceipt(
+            runId, "tenant-test", new List<string> { "reason1" }, plan, ledger, new FcSigner());
+
+        // Assert — scratch-buffer hashing yields the digest of the canonical bytes
+        Assert.Equal(
+            FcSigner.ComputeSha256Bytes(FcSigner.ToCanonicalJsonBytes(plan)),
+            advisory.Subject.SubjectDigests.PlanSha256);
+        Assert.Equal(
+            FcSigner.ComputeSha256Bytes(FcSigner.ToCanonicalJsonBytes(ledger)),
+            advisory.Subject.SubjectDigests.LedgerSha256);
+
+        // Reusing the per-thread buffer after a larger payload must not leak stale bytes,
+        // and a payload past the retention cap must leave a working fresh buffer behind
+        var expectedLedgerSha256 = Convert.ToHexStringLower(SHA256.HashData(FcSigner.ToCanonicalJsonBytes(ledger)));
+        var before = FcSigner.ComputeCanonicalSha256(ledger);
+        FcSigner.ComputeCanonicalSha256(new { Filler = new string('x', 16 * 1024), Ledger = ledger });
+        var afterReuse = FcSigner.ComputeCanonicalSha256(ledger);
+        FcSigner.ComputeCanonicalSha256(new { Filler = new string('x', 256 * 1024), Ledger = ledger });
+        var afterRelease = FcSigner.ComputeCanonicalSha256(ledger);
+        Assert.Equal(expectedLedgerSha256, before);
+        Assert.Equal(expectedLedgerSha256, afterReuse);
+        Assert.Equal(expectedLedgerSha256, afterRelease);
+    }
+
     [Fact]
     public void DryRun_GeneratesPublicationPlanAndProofLedger()
     {
@@ -103,6 +174,37 @@ public sealed class DryRunLawTests
         Assert.NotNull(ledger);
     }
 
+    [Fact]
+    public async Task DryRun_PolicyDenialMarksOnlyTheViolatingIntent()
+    {
+        // Arrange
+        var run = new MarketOpsRun(
+            RunId: "test-run-policy",
+            TenantId: "tenant-test",
+            Mode: ExecutionMode.DryRun,
+            StartedAt: DateTimeOffset.UtcNow,
+            Input: new Dictionary<string, object?> { ["simulateViolation"] = "direct_push_main" });
+        var candidate = new ArtifactMetadata(
+            Id: "a1", Type: "missing_readme", Hash: "h", CreatedAt: DateTimeOffset.UtcNow,
+            RepoPath: "repos/docs", FilePath: "README.md", Description: "README is missing");
+        var verified = new VerificationResult(true, new List<string>(), new List<ArtifactMetadata> { candidate });
+
+        // Act
+        var evaluated = await new PipelineStages().EvaluateAsync(run, verified);
+
+        // Assert
+        Assert.False(evaluated.IsApproved);
+        Assert.Equal(2, evaluated.EvaluatedIntents.Count);
+        var clean = evaluated.EvaluatedIntents[0];
+        var violation = evaluated.EvaluatedIntents[1];
+        Assert.False(clean.BlockedByPolicy);
+        Assert.Empty(clean.PolicyDenialReasons);
+        Assert.True(violation.BlockedByPolicy);
+        Assert.Equal(
+            $"Intent {violation.Id} targets direct push to main (blocked by policy)",
+            Assert.Single(violation.PolicyDenialReasons));
+    }
+
     [Fact]
     public void MarketOpsRun_ValidatesModeIsSet()
     {
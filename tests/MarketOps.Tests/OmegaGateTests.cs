@@ -65,6 +65,63 @@ public sealed class OmegaGateTests
         Assert.Empty(result.Governance.VerificationSummary.ErrorCodes);
     }
 
+    [Fact]
+    public async Task UnlistedDestination_DeniesWithPrecheckStage()
+    {
+        var gate = BuildGate();
+        var result = await gate.EvaluateAsync(CreatePacket(
+            destinations: new[] { "federation.systems/site-docs", "github:federation/private" }));
+
+        Assert.False(result.Allowed);
+        Assert.Equal(FailureStage.Precheck, result.FailureStage);
+        Assert.Equal("DESTINATION_NOT_ALLOWED", result.DenialCode);
+        Assert.Equal("Denied: github:federation/private", result.DenialMessage);
+    }
+
+    [Fact]
+    public async Task UnsafePayloadPath_DeniesWithPrecheckStage()
+    {
+        var gate = BuildGate();
+
+        foreach (var path in new[] { "docs/../secret.bin", "..\\payload.bin", "docs/c:payload.bin" })
+        {
+            var result = await gate.EvaluateAsync(CreatePacket(payloadPath: path));
+
+            Assert.False(result.Allowed);
+            Assert.Equal(FailureStage.Precheck, result.FailureStage);
+            Assert.Equal("PAYLOAD_REF_INVALID", result.DenialCode);
+        }
+
+        var nested = await gate.EvaluateAsync(CreatePacket(payloadPath: "docs//..notes/payload.bin"));
+        Assert.True(nested.Allowed);
+    }
+
+    [Fact]
+    public void IsDestinationAllowed_FollowsAllowlistOnCopiedConfig()
+    {
+        var config = MarketOpsGateConfig.Build(null);
+        var narrowed = config with { Allowlist = new[] { "github:federation/specs" } };
+
+        Assert.True(config.IsDestinationAllowed("federation.systems/site-docs"));
+        Assert.False(config.IsDestinationAllowed("Federation.Systems/site-docs"));
+        Assert.False(narrowed.IsDestinationAllowed("federation.systems/site-docs"));
+        Assert.True(narrowed.IsDestinationAllowed("github:federation/specs"));
+    }
+
+    [Fact]
+    public void IsDestinationAllowed_IgnoresLaterChangesToCallerList()
+    {
+        var destinations = new List<string> { "github:federation/specs" };
+        var config = MarketOpsGateConfig.Build(null) with { Allowlist = destinations };
+
+        destinations.Add("github:federation/private");
+        destinations.Remove("github:federation/specs");
+
+        Assert.True(config.IsDestinationAllowed("github:federation/specs"));
+        Assert.False(config.IsDestinationAllowed("github:federation/private"));
+        Assert.Equal("github:federation/specs", Assert.Single(config.Allowlist));
+    }
+
     private static OmegaGate BuildGate(
         IGovernanceDecisionClient? decision = null,
         IGovernanceAuditWriter? auditWriter = null,
@@ -79,7 +136,10 @@ public sealed class OmegaGateTests
             executionClient);
     }
 
-    private static PublishPacket CreatePacket(string? sha256 = "deadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeef")
+    private static PublishPacket CreatePacket(
+        string? sha256 = "deadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeefdeadbeef",
+        string[]? destinations = null,
+        string payloadPath = "payload.bin")
     {
         return new PublishPacket(
             ArtifactId: "artifact",
@@ -89,8 +149,8 @@ public sealed class OmegaGateTests
             CorrelationId: Guid.NewGuid().ToString("D"),
             ActorId: "operator-marketops",
             SourceRefs: Array.Empty<string>(),
-            PayloadRef: new PayloadRef("file", "payload.bin", Sha256: sha256),
-            Destinations: new[] { "federation.systems/site-docs" });
+            PayloadRef: new PayloadRef("file", payloadPath, Sha256: sha256),
+            Destinations: destinations ?? new[] { "federation.systems/site-docs" });
     }
 
     private sealed class FixedDecisionClient : IGovernanceDecisionClient
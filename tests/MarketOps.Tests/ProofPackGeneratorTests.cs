@@ -0,0 +1,170 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using System.Text.Json.Serialization.Metadata;
+using MarketOps.Artifacts;
+using MarketOps.Contracts;
+using MarketOps.Ports;
+using MarketOps.Security;
+using Xunit;
+
+namespace MarketOps.Tests;
+
+/// <summary>
+/// Tests for Proof Pack sealing.
+/// The pack seal is SHA-256 over the run manifest hashes concatenated in runId order,
+/// which is what VERIFY.ps1 recomputes offline.
+/// </summary>
+public sealed class ProofPackGeneratorTests
+{
+    [Fact]
+    public void Generate_SealsManifestHashesInRunIdOrder()
+    {
+        // Arrange — runs supplied out of runId order
+        var runs = new List<ProofPackRunInput>
+        {
+            CreateRunInput("run-c"),
+            CreateRunInput("run-a"),
+            CreateRunInput("run-b")
+        };
+        var outputDir = Path.Combine(Path.GetTempPath(), $"proofpack-test-{Guid.NewGuid():N}");
+
+        try
+        {
+            // Act
+            var index = new ProofPackGenerator().Generate(outputDir, runs);
+
+            // Assert — entries are sorted and each hash matches the manifest on disk
+            Assert.Equal(new[] { "run-a", "run-b", "run-c" }, index.Runs.Select(r => r.RunId));
+            foreach (var entry in index.Runs)
+            {
+                var manifestBytes = File.ReadAllBytes(Path.Combine(outputDir, entry.Path));
+                Assert.Equal(Convert.ToHexStringLower(SHA256.HashData(manifestBytes)), entry.Sha256);
+            }
+
+            var concatenated = string.Concat(index.Runs.Select(r => r.Sha256));
+            var expectedSeal = Convert.ToHexStringLower(SHA256.HashData(Encoding.UTF8.GetBytes(concatenated)));
+            Assert.Equal(expectedSeal, index.PackSha256);
+        }
+        finally
+        {
+            if (Directory.Exists(outputDir))
+                Directory.Delete(outputDir, recursive: true);
+        }
+    }
+
+    [Fact]
+    public void CanonicalJson_SourceGeneratedMatchesReflection()
+    {
+        // Arrange — strings with characters the encoder must treat identically on both paths
+        var generator = new ArtifactGenerator();
+        var plan = generator.GeneratePublicationPlan(
+            "run-canon", "tenant-test", ExecutionMode.DryRun,
+            new List<object>(), new List<object>(), new Dictionary<string, string>());
+        var ledger = generator.GenerateProofLedger(
+            "run-canon", "tenant-test", ExecutionMode.DryRun,
+            new List<SideEffectIntent>(), new List<SideEffectReceipt>());
+        var receipt = generator.GenerateAdvisoryReceipt(
+            "run-canon", "tenant-test", new List<string> { "policy <denied> & \"quoted\" — café" },
+            plan, ledger, new FcSigner());
+        var manifest = new RunManifest(
+            SchemaVersion: "marketops.proofpack.run-manifest.v1.3",
+            RunId: "run-canon",
+            TenantId: "tenant-test",
+            IssuedAt: new DateTimeOffset(2026, 1, 2, 3, 4, 5, TimeSpan.Zero),
+            Mode: "dry_run",
+            Scenario: "canonical <parity> & café",
+            Source: new SourceInfo("host", "MarketOps.Api.Host", null, Git: null),
+            Scope: new ManifestScope("tenant-test", new List<string> { "repos/docs" }, 1, 2),
+            Invariants: new InvariantSet(true, true, true),
+            Artifacts: new List<ArtifactEntry>
+            {
+                new("proof-ledger.json", "artifacts/proof-ledger.json", "application/json", new string('a', 64), 123)
+            },
+            Rollup: new ManifestRollup(2, 2, 0, "approved", "advisory"),
+            ManifestSignature: new ManifestSignature(
+                "ed25519", "key-1", "keys/proofpack_signing_public.ed25519", "c2ln",
+                new DateTimeOffset(2026, 1, 2, 3, 4, 6, TimeSpan.Zero)));
+
+        // Act / Assert — reflection metadata (FcSigner default) vs generated metadata.
+        // The canonical options set a relaxed encoder, so both run the metadata-driven
+        // serializer; the generated fast path is covered by the file-output test below.
+        Assert.Equal(
+            FcSigner.ToCanonicalJsonBytes(receipt),
+            FcSigner.ToCanonicalJsonBytes(receipt, ArtifactCanonicalJson.Options));
+        Assert.Equal(
+            FcSigner.ToCanonicalJsonBytes(manifest),
+            FcSigner.ToCanonicalJsonBytes(manifest, ArtifactCanonicalJson.Options));
+    }
+
+    [Fact]
+    public void Generate_FileOutputMatchesReflectionSerializer()
+    {
+        // Arrange — the indented file options take the generated fast path; the
+        // manifest bytes feed the pack seal, so they must match reflection output
+        var runs = new List<ProofPackRunInput>
+        {
+            CreateRunInput("run-a", "file <parity> & \"quoted\" — café")
+        };
+        var outputDir = Path.Combine(Path.GetTempPath(), $"proofpack-test-{Guid.NewGuid():N}");
+        var reflectionOpts = new JsonSerializerOptions
+        {
+            PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+            DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+            WriteIndented = true,
+            TypeInfoResolver = new DefaultJsonTypeInfoResolver()
+        };
+
+        try
+        {
+            // Act
+            new ProofPackGenerator().Generate(outputDir, runs);
+
+            // Assert — round-trip each file through the reflection serializer
+            var manifestBytes = File.ReadAllBytes(Path.Combine(outputDir, "runs", "run-a", "RUN_MANIFEST.json"));
+            var manifest = JsonSerializer.Deserialize<RunManifest>(manifestBytes, reflectionOpts)!;
+            Assert.Equal(manifestBytes, JsonSerializer.SerializeToUtf8Bytes(manifest, reflectionOpts));
+
+            var indexBytes = File.ReadAllBytes(Path.Combine(outputDir, "PACK_INDEX.json"));
+            var index = JsonSerializer.Deserialize<PackIndex>(indexBytes, reflectionOpts)!;
+            Assert.Equal(indexBytes, JsonSerializer.SerializeToUtf8Bytes(index, reflectionOpts));
+        }
+        finally
+        {
+            if (Directory.Exists(outputDir))
+                Directory.Delete(outputDir, recursive: true);
+        }
+    }
+
+    private static ProofPackRunInput CreateRunInput(string runId, string scenario = "seal-order")
+    {
+        var generator = new ArtifactGenerator();
+        var startedAt = DateTimeOffset.UtcNow;
+        var plan = generator.GeneratePublicationPlan(
+            runId, "tenant-test", ExecutionMode.DryRun,
+            new List<object>(), new List<object>(), new Dictionary<string, string>());
+        var ledger = generator.GenerateProofLedger(
+            runId, "tenant-test", ExecutionMode.DryRun,
+            new List<SideEffectIntent>(), new List<SideEffectReceipt>());
+        var summary = new ApproverSummaryGenerator().Generate(
+            runId, "tenant-test", "dry_run", startedAt,
+            new List<SideEffectIntent>(), new List<SideEffectReceipt>());
+
+        return new ProofPackRunInput(
+            RunId: runId,
+            TenantId: "tenant-test",
+            Scenario: scenario,
+            Mode: "dry_run",
+            StartedAt: startedAt,
+            Plan: plan,
+            Ledger: ledger,
+            Advisory: null,
+            Summary: summary,
+            SummaryMarkdown: new ApproverSummaryMarkdownRenderer().Render(summary));
+    }
+}